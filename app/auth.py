@@ -1,14 +1,93 @@
+import hashlib
+import os
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import anyio
+import bcrypt
+import jwt
+import orjson
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from app import fasttoken
 from app.config import settings
 from app.models import User
 
-# Password hashing context
-# bcrypt is a secure hashing algorithm
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Secret comparisons
+# Never compare secrets (password hashes, token signatures, API keys) with ==,
+# which returns as soon as a byte differs and so leaks through timing how much
+# of a guess was right (the memcmp MAC-check flaw behind past OpenVPN
+# advisories). Use hmac.compare_digest, or an API that compares in constant
+# time: bcrypt.checkpw and fasttoken.verify both do. The token cache is keyed
+# by SHA-256 digests, so lookups in it reveal nothing about the tokens.
+
+# Password hashing
+# bcrypt is called directly (no passlib dispatch); the work factor comes from
+# settings so it can be tuned per deployment
+
+# bcrypt work runs on its own limiter sized to the CPU count, so slow hashing
+# can't starve the default threadpool that serves database calls.
+# Created lazily because anyio limiters must be built inside the event loop.
+_bcrypt_limiter: Optional[anyio.CapacityLimiter] = None
+
+def _get_bcrypt_limiter() -> anyio.CapacityLimiter:
+    global _bcrypt_limiter
+    if _bcrypt_limiter is None:
+        _bcrypt_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+    return _bcrypt_limiter
+
+# Hash checked when the login doesn't match any user, so unknown accounts take
+# as long to reject as wrong passwords and response times don't reveal which
+# usernames exist
+_DUMMY_HASH = bcrypt.hashpw(
+    b"dummy-password", bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+).decode("utf-8")
+
+# Verified-token cache
+# Maps sha256(token) -> (username, exp) for a few seconds so repeat requests
+# skip JWT decoding. It only remembers tokens that already verified; tokens
+# stay valid until exp.
+_token_cache = TTLCache(maxsize=10000, ttl=settings.token_cache_ttl_seconds)
+_token_cache_lock = threading.Lock()
+
+# Current time at one-second resolution as (unix_second, datetime), rebuilt
+# only when the second rolls over. Token expiry is measured in minutes, so a
+# clock that is up to a second stale is fine there.
+_now_cache = (0, datetime.fromtimestamp(0, timezone.utc))
+
+def _utcnow() -> datetime:
+    """
+    Return the current UTC time, truncated to the second.
+    """
+    global _now_cache
+    second = int(time.time())
+    cached_second, now = _now_cache
+    if second != cached_second:
+        now = datetime.fromtimestamp(second, timezone.utc)
+        # Single tuple assignment, so other threads never see a torn pair
+        _now_cache = (second, now)
+    return now
+
+def token_cache_key(token: str) -> bytes:
+    """
+    Return the cache key for a token (its SHA-256 digest).
+    """
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+def _bcrypt_input(password: str) -> bytes:
+    """
+    Encode a password for bcrypt, truncated to the bytes bcrypt actually uses.
+    
+    Slicing to 72 characters first means a multi-megabyte password costs no
+    more to encode than a short one; 72 characters always cover 72 bytes.
+    """
+    max_bytes = BCRYPT_MAX_PASSWORD_BYTES
+    return password[:max_bytes].encode("utf-8")[:max_bytes]
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -21,7 +100,10 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        _bcrypt_input(plain_password),
+        hashed_password.encode("utf-8")
+    )
 
 def get_password_hash(password: str) -> str:
     """
@@ -33,7 +115,33 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(_bcrypt_input(password), salt).decode("utf-8")
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+    
+    Runs verify_password in a worker thread bounded by the bcrypt limiter.
+    """
+    return await anyio.to_thread.run_sync(
+        verify_password,
+        plain_password,
+        hashed_password,
+        limiter=_get_bcrypt_limiter()
+    )
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+    
+    Runs get_password_hash in a worker thread bounded by the bcrypt limiter.
+    """
+    return await anyio.to_thread.run_sync(
+        get_password_hash,
+        password,
+        limiter=_get_bcrypt_limiter()
+    )
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -50,15 +158,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     
     # Set expiration time
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = _utcnow() + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
+        expire = _utcnow() + timedelta(
             minutes=settings.access_token_expire_minutes
         )
     
-    to_encode.update({"exp": expire})
+    # Create JWT token (HS256 goes through the fast signer)
+    if settings.algorithm == "HS256":
+        to_encode.update({"exp": int(expire.timestamp())})
+        return fasttoken.sign(orjson.dumps(to_encode))
     
-    # Create JWT token
+    to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
         to_encode, 
         settings.secret_key, 
@@ -67,6 +178,47 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     
     return encoded_jwt
 
+def _decode_token(token: str) -> Optional[dict]:
+    """
+    Check a token's signature and expiry and return its claims.
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        Claims if token is valid and carries exp and sub, None otherwise
+    """
+    if settings.algorithm != "HS256":
+        try:
+            return jwt.decode(
+                token, 
+                settings.secret_key, 
+                algorithms=[settings.algorithm],
+                options={"require": ["exp", "sub"]}
+            )
+        except jwt.PyJWTError:
+            return None
+    
+    payload = fasttoken.verify(token)
+    if payload is None:
+        return None
+    
+    try:
+        claims = orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        return None
+    
+    if not isinstance(claims, dict):
+        return None
+    
+    expire = claims.get("exp")
+    if not isinstance(expire, (int, float)) or expire <= time.time():
+        return None
+    if not isinstance(claims.get("sub"), str):
+        return None
+    
+    return claims
+
 def verify_token(token: str) -> Optional[str]:
     """
     Verify and decode a JWT token.
@@ -77,25 +229,70 @@ def verify_token(token: str) -> Optional[str]:
     Returns:
         Username if token is valid, None otherwise
     """
-    try:
-        # Decode JWT token
-        payload = jwt.decode(
-            token, 
-            settings.secret_key, 
-            algorithms=[settings.algorithm]
-        )
+    key = token_cache_key(token)
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    
+    # Cache hit: only the expiry needs checking
+    if cached is not None:
+        username, expire = cached
+        if expire > time.time():
+            return username
+    
+    # Decode JWT token
+    payload = _decode_token(token)
+    if payload is None:
+        return None
+    
+    # Extract username from token
+    username: str = payload["sub"]
+    
+    with _token_cache_lock:
+        _token_cache[key] = (username, payload["exp"])
         
-        # Extract username from token
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-            
-        return username
+    return username
+
+def clear_token_caches() -> None:
+    """
+    Drop all cached tokens.
+    """
+    with _token_cache_lock:
+        _token_cache.clear()
+
+def get_user_by_login(db: Session, login: str) -> Optional[User]:
+    """
+    Find a user by username or email.
+    
+    Args:
+        db: Database session
+        login: Username or email
         
-    except JWTError:
+    Returns:
+        User object if found, None otherwise
+    """
+    return db.query(User).filter(
+        (User.username == login) | (User.email == login)
+    ).first()
+
+def _hash_rounds(hashed_password: str) -> Optional[int]:
+    """
+    Return the work factor of a bcrypt hash ("$2b$<rounds>$..."), or None.
+    """
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
         return None
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+def _store_password_hash(db: Session, user: User, hashed_password: str) -> None:
+    """
+    Save a new password hash for a user.
+    """
+    user.hashed_password = hashed_password
+    db.commit()
+    db.refresh(user)  # Reload now, not lazily on the event loop
+
+async def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
     """
     Authenticate a user with username and password.
     
@@ -107,15 +304,21 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Use
     Returns:
         User object if authentication successful, None otherwise
     """
-    # Find user by username or email
-    user = db.query(User).filter(
-        (User.username == username) | (User.email == username)
-    ).first()
+    # Find user by username or email (database work stays on the default threadpool)
+    user = await run_in_threadpool(get_user_by_login, db, username)
     
-    if not user:
-        return None
-        
-    if not verify_password(password, user.hashed_password):
+    # Always run one bcrypt check, against a dummy hash if the user is missing
+    hashed_password = user.hashed_password if user else _DUMMY_HASH
+    password_valid = await averify_password(password, hashed_password)
+    
+    if not user or not password_valid:
         return None
+    
+    # Rehash passwords stored with another work factor (e.g. passlib's default
+    # of 12), so every account costs the same to check as the dummy hash and
+    # gets the configured speed
+    if _hash_rounds(user.hashed_password) != settings.bcrypt_rounds:
+        new_hash = await aget_password_hash(password)
+        await run_in_threadpool(_store_password_hash, db, user, new_hash)
         
     return user
\ No newline at end of file
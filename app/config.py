@@ -1,4 +1,5 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 class Settings(BaseSettings):
@@ -13,19 +14,33 @@ class Settings(BaseSettings):
     
     # Database settings
     database_url: str = "sqlite:///./todo_app.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    sql_echo: bool = False  # Log every SQL statement (slow, debugging only)
     
     # Security settings
     secret_key: str = "your-super-secret-key-change-this-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    token_cache_ttl_seconds: int = 5  # How long verified tokens are cached
+    bcrypt_rounds: int = 10  # bcrypt cost factor (2^rounds iterations)
     
     # App settings
     app_name: str = "Todo API"
     debug: bool = True
     
-    class Config:
-        # Tell Pydantic to load from .env file
-        env_file = ".env"
+    # Tell Pydantic to load from .env file; settings are read-only once loaded
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
 
-# Create a global settings instance
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings.
+    
+    The environment and .env file are only read on the first call; every
+    later call returns the same frozen instance.
+    """
+    return Settings()
+
+# Global settings instance shared by all modules
+settings = get_settings()
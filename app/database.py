@@ -1,14 +1,45 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+database_url = make_url(settings.database_url)
+is_sqlite = database_url.get_backend_name() == "sqlite"
+
+engine_options = {
+    # echo=True shows SQL queries in console (useful for debugging)
+    "echo": settings.sql_echo,
+    "pool_pre_ping": True,  # Drop dead connections before handing them out
+}
+
+if is_sqlite:
+    # Sessions may be used from several threadpool threads
+    engine_options["connect_args"] = {"check_same_thread": False}
+
+# In-memory SQLite uses a single shared connection, so there is no pool to size
+if database_url.database not in (None, "", ":memory:"):
+    engine_options["pool_size"] = settings.db_pool_size
+    engine_options["max_overflow"] = settings.db_max_overflow
+
 # Create database engine
-# echo=True shows SQL queries in console (useful for debugging)
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug  # Show SQL queries when debug=True
-)
+engine = create_engine(settings.database_url, **engine_options)
+
+if is_sqlite:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Tune every new SQLite connection.
+        
+        WAL lets readers keep going while a write is in progress, and
+        synchronous=NORMAL is safe with WAL while avoiding an fsync per commit.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.close()
 
 # Create session factory
 # Sessions handle database transactions
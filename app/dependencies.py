@@ -1,15 +1,52 @@
+import threading
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.auth import verify_token
+from app.auth import token_cache_key, verify_token
+from app.config import settings
 from app.models import User
 
 # OAuth2 scheme for JWT tokens
 # tokenUrl points to our login endpoint
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Shared auth errors
+# Detail and headers are module constants, but each raise gets a new
+# HTTPException: re-raising one instance appends every request's frames to
+# its __traceback__ and keeps them (and their sessions) alive forever
+CREDENTIALS_DETAIL = "Could not validate credentials"
+CREDENTIALS_HEADERS = {"WWW-Authenticate": "Bearer"}
+INACTIVE_USER_DETAIL = "Inactive user"
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=CREDENTIALS_DETAIL,
+        headers=CREDENTIALS_HEADERS,
+    )
+
+def _inactive_user_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=INACTIVE_USER_DETAIL
+    )
+
+# Short-lived cache of users looked up by token, keyed like the token cache.
+# Cached users are detached from their session so later commits don't expire
+# them; the token is still verified (at least for expiry) on every request.
+_user_cache = TTLCache(maxsize=10000, ttl=settings.token_cache_ttl_seconds)
+_user_cache_lock = threading.Lock()
+
+def clear_user_cache() -> None:
+    """
+    Drop all cached users.
+    """
+    with _user_cache_lock:
+        _user_cache.clear()
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -29,22 +66,26 @@ async def get_current_user(
     - User doesn't exist
     """
     
-    # Create credentials exception
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     # Verify token and get username
     username = verify_token(token)
     if username is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    
+    # Reuse a recently loaded user for this token if we have one
+    key = token_cache_key(token)
+    with _user_cache_lock:
+        user = _user_cache.get(key)
+    if user is not None:
+        return user
     
     # Look up user in database
     user = db.query(User).filter(User.username == username).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    
+    db.expunge(user)
+    with _user_cache_lock:
+        _user_cache[key] = user
         
     return user
 
@@ -64,8 +105,5 @@ async def get_current_active_user(
         HTTPException if user is inactive
     """
     if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
+        raise _inactive_user_exception()
     return current_user
\ No newline at end of file
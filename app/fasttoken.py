@@ -0,0 +1,79 @@
+import base64
+import binascii
+import hmac
+from typing import Optional
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hmac as crypto_hmac
+from app.config import settings
+
+# Minimal HS256 token signing
+# Tokens use the standard JWS compact format (header.payload.signature), so
+# they are ordinary JWTs that any HS256 library can verify. Signing goes
+# straight to OpenSSL's HMAC-SHA256 (SHA-NI accelerated where available)
+# instead of through a generic JWT library.
+# Tag and header checks go through hmac.compare_digest (see app/auth.py).
+
+def _b64encode(data: bytes) -> bytes:
+    """Base64url-encode without padding."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64decode(data: bytes) -> bytes:
+    """Base64url-decode, restoring the stripped padding."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+# The header never changes, so encode it once
+_HEADER = _b64encode(b'{"alg":"HS256","typ":"JWT"}')
+
+def _signature(signing_input: bytes) -> bytes:
+    """Compute the HMAC-SHA256 tag for the header.payload segment."""
+    h = crypto_hmac.HMAC(settings.secret_key.encode("utf-8"), hashes.SHA256())
+    h.update(signing_input)
+    return h.finalize()
+
+def sign(payload: bytes) -> str:
+    """
+    Sign a JSON payload and return the token.
+
+    Args:
+        payload: JSON-encoded claims
+
+    Returns:
+        Token string
+    """
+    signing_input = _HEADER + b"." + _b64encode(payload)
+    token = signing_input + b"." + _b64encode(_signature(signing_input))
+    return token.decode("ascii")
+
+def verify(token: str) -> Optional[bytes]:
+    """
+    Check a token's signature and return its payload.
+
+    Only the signature is checked here; claims such as exp are left to
+    the caller.
+
+    Args:
+        token: Token string
+
+    Returns:
+        JSON-encoded claims if the signature is valid, None otherwise
+    """
+    try:
+        header, payload, signature = token.encode("ascii").split(b".")
+    except (UnicodeEncodeError, ValueError):
+        return None
+
+    # Only our own header is accepted, which also rules out alg confusion
+    if not hmac.compare_digest(header, _HEADER):
+        return None
+
+    # Compare against the canonical encoding of the expected tag, so a token
+    # has exactly one valid spelling (base64url leaves spare bits in the last
+    # character that a lenient decoder would ignore)
+    expected = _b64encode(_signature(header + b"." + payload))
+    if not hmac.compare_digest(signature, expected):
+        return None
+
+    try:
+        return _b64decode(payload)
+    except (binascii.Error, ValueError):
+        return None
@@ -1,7 +1,9 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from app.database import engine, Base
+from app.middleware import PreflightCacheMiddleware
 from app.routers import auth, todos
 
 # Create database tables
@@ -13,17 +15,24 @@ app = FastAPI(
     description="A professional Todo API with JWT authentication",
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc"  # ReDoc
+    redoc_url="/redoc",  # ReDoc
+    default_response_class=ORJSONResponse  # Serialize responses with orjson
 )
 
+# CORS policy, shared by both CORS middlewares so they can't drift apart
+CORS_OPTIONS = {
+    "allow_origins": ["http://localhost:3000", "http://localhost:8080"],  # Frontend URLs
+    "allow_credentials": True,
+    "allow_methods": ["*"],
+    "allow_headers": ["*"],
+}
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:8080"],  # Frontend URLs
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(CORSMiddleware, **CORS_OPTIONS)
+
+# Answer preflights from known origins before they reach CORSMiddleware
+# (added last so it runs first)
+app.add_middleware(PreflightCacheMiddleware, **CORS_OPTIONS)
 
 # Include routers
 app.include_router(auth.router)
@@ -0,0 +1,83 @@
+from typing import Optional, Sequence
+from starlette.middleware.cors import ALL_METHODS
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+class PreflightCacheMiddleware:
+    """
+    Answer CORS preflight requests from known origins with precomputed headers.
+
+    Takes the same policy arguments as CORSMiddleware and sends what it would
+    send, but builds the response headers once per origin instead of parsing
+    and assembling them on every OPTIONS request. Only policies that allow
+    all methods and all headers for a fixed origin list are precomputed; for
+    any other policy, and for every request it doesn't answer (including
+    preflights from unknown origins), it passes through so CORSMiddleware
+    still handles it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        allow_origin_regex: Optional[str] = None,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600
+    ) -> None:
+        self.app = app
+        self.allow_methods = {method.encode("latin-1") for method in ALL_METHODS}
+        self.preflight_headers = {}
+
+        # Anything else needs per-request checks, so leave it to CORSMiddleware
+        # (expose_headers only affects simple responses, not preflights)
+        if (
+            "*" not in allow_methods
+            or "*" not in allow_headers
+            or "*" in allow_origins
+        ):
+            return
+
+        shared_headers = [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2"),
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", ", ".join(ALL_METHODS).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if allow_credentials:
+            shared_headers.append((b"access-control-allow-credentials", b"true"))
+
+        self.preflight_headers = {
+            origin.encode("latin-1"): shared_headers + [
+                (b"access-control-allow-origin", origin.encode("latin-1"))
+            ]
+            for origin in allow_origins
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        origin = requested_method = requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                requested_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        headers = self.preflight_headers.get(origin)
+        if headers is None or requested_method not in self.allow_methods:
+            await self.app(scope, receive, send)
+            return
+
+        # All headers are allowed, so requested headers are mirrored back
+        if requested_headers is not None:
+            headers = headers + [(b"access-control-allow-headers", requested_headers)]
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
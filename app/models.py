@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -39,8 +39,16 @@ class Todo(Base):
     """
     __tablename__ = "todos"
     
-    # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    # Composite indexes matching how todos are queried (always per owner):
+    # - (owner_id, completed) for the completion filter
+    # - (owner_id, id) for single-todo lookups and id-ordered pages
+    __table_args__ = (
+        Index("ix_todos_owner_completed", "owner_id", "completed"),
+        Index("ix_todos_owner_id_id", "owner_id", "id"),
+    )
+    
+    # Primary key (already indexed by the database)
+    id = Column(Integer, primary_key=True)
     
     # Todo content
     title = Column(String(200), nullable=False)
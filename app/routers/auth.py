@@ -1,11 +1,17 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import User
 from app.schemas import UserCreate, UserResponse, Token, Message
-from app.auth import get_password_hash, authenticate_user, create_access_token
+from app.auth import (
+    aget_password_hash,
+    authenticate_user,
+    create_access_token,
+)
 from app.config import settings
 from app.dependencies import get_current_active_user
 
@@ -15,43 +21,33 @@ router = APIRouter(
     tags=["Authentication"]
 )
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register_user(
-    user_data: UserCreate,
-    db: Session = Depends(get_db)
-):
+def _ensure_user_available(db: Session, user_data: UserCreate) -> None:
     """
-    Register a new user account.
-    
-    Args:
-        user_data: User registration data (email, username, password)
-        db: Database session
-        
-    Returns:
-        Created user data (without password)
-        
-    Raises:
-        HTTPException 400: If email or username already exists
+    Raise HTTPException 400 if the email or username is already in use.
     """
     
-    # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
+    # Check email and username in one query (both columns are indexed)
+    existing = db.query(User.email, User.username).filter(
+        or_(User.email == user_data.email, User.username == user_data.username)
+    ).all()
+    
+    # Email conflicts take precedence over username conflicts
+    if any(row.email == user_data.email for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
-    if existing_user:
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
-    
-    # Hash password
-    hashed_password = get_password_hash(user_data.password)
+
+def _create_user(db: Session, user_data: UserCreate, hashed_password: str) -> User:
+    """
+    Insert a new user row and return it.
+    """
     
     # Create new user
     db_user = User(
@@ -67,8 +63,35 @@ def register_user(
     
     return db_user
 
+@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def register_user(
+    user_data: UserCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    Register a new user account.
+    
+    Args:
+        user_data: User registration data (email, username, password)
+        db: Database session
+        
+    Returns:
+        Created user data (without password)
+        
+    Raises:
+        HTTPException 400: If email or username already exists
+    """
+    
+    # Database work runs on the default threadpool, hashing on the bcrypt limiter
+    await run_in_threadpool(_ensure_user_available, db, user_data)
+    
+    # Hash password
+    hashed_password = await aget_password_hash(user_data.password)
+    
+    return await run_in_threadpool(_create_user, db, user_data, hashed_password)
+
 @router.post("/login", response_model=Token)
-def login_user(
+async def login_user(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -87,7 +110,7 @@ def login_user(
     """
     
     # Authenticate user
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,17 +1,45 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy import delete, func, lambda_stmt, select, update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Todo, User
-from app.schemas import TodoCreate, TodoUpdate, TodoResponse, TodoListResponse
+from app.schemas import Message, TodoCreate, TodoUpdate, TodoResponse, TodoListResponse
 from app.dependencies import get_current_active_user
-from app.schemas import Message
 
 router = APIRouter(
     prefix="/todos",
     tags=["Todos"]
 )
 
+# Columns needed for TodoResponse
+# Selecting plain columns for read-only lists skips ORM object creation and
+# identity-map tracking for every row
+TODO_COLUMNS = (
+    Todo.id,
+    Todo.title,
+    Todo.description,
+    Todo.completed,
+    Todo.owner_id,
+    Todo.created_at,
+    Todo.updated_at,
+)
+
+# Statements for a single todo owned by the current user
+# lambda_stmt caches the built statement by the lambda's code, so only the
+# todo_id/owner_id values are bound on each request
+def _select_owned_todo(todo_id: int, owner_id: int) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(Todo).where(Todo.id == todo_id, Todo.owner_id == owner_id)
+    )
+
+def _delete_owned_todo(todo_id: int, owner_id: int) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: delete(Todo).where(Todo.id == todo_id, Todo.owner_id == owner_id)
+    )
+
 @router.get("", response_model=TodoListResponse)
 def get_todos(
     page: int = Query(1, ge=1, description="Page number"),
@@ -33,35 +61,65 @@ def get_todos(
         db: Database session
         
     Returns:
-        Paginated list of todos
+        Paginated list of todos (shaped like TodoListResponse)
     """
     
-    # Base query - only user's todos
-    query = db.query(Todo).filter(Todo.owner_id == current_user.id)
+    # Base filter - only user's todos
+    filters = [Todo.owner_id == current_user.id]
     
     # Apply filters
     if completed is not None:
-        query = query.filter(Todo.completed == completed)
+        filters.append(Todo.completed == completed)
     
     if search:
         search_term = f"%{search}%"
-        query = query.filter(
-            (Todo.title.ilike(search_term)) | 
-            (Todo.description.ilike(search_term))
-        )
-    
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
+        if db.get_bind().dialect.name == "sqlite":
+            # SQLite's LIKE is already case-insensitive (ASCII, exactly like
+            # its lower()), so skip the two lower() calls per row ilike adds
+            filters.append(
+                (Todo.title.like(search_term)) | 
+                (Todo.description.like(search_term))
+            )
+        else:
+            filters.append(
+                (Todo.title.ilike(search_term)) | 
+                (Todo.description.ilike(search_term))
+            )
+    
+    # Fetch the page and the total count in one query:
+    # COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so every row carries it
     offset = (page - 1) * per_page
-    todos = query.offset(offset).limit(per_page).all()
+    stmt = (
+        select(*TODO_COLUMNS, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Todo.id)
+        .offset(offset)
+        .limit(per_page)
+    )
+    rows = db.execute(stmt).all()
+    
+    # An empty page past the end has no row to read the total from
+    if rows:
+        total = rows[0].total
+    elif offset:
+        total = db.scalar(select(func.count()).select_from(Todo).where(*filters))
+    else:
+        total = 0
+    
+    # Encode the page straight from the rows: the columns already match
+    # TodoResponse, so building Pydantic models just to dump them is skipped
+    todos_json = b",".join(
+        orjson.dumps(
+            {name: value for name, value in row._mapping.items() if name != "total"},
+            option=orjson.OPT_UTC_Z
+        )
+        for row in rows
+    )
+    page_json = orjson.dumps({"total": total, "page": page, "per_page": per_page})
     
-    return TodoListResponse(
-        todos=todos,
-        total=total,
-        page=page,
-        per_page=per_page
+    return Response(
+        content=b'{"todos":[' + todos_json + b"]," + page_json[1:],
+        media_type="application/json"
     )
 
 @router.post("", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
@@ -118,10 +176,9 @@ def get_todo(
     """
     
     # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.owner_id == current_user.id
-    ).first()
+    todo = db.execute(
+        _select_owned_todo(todo_id, current_user.id)
+    ).scalar_one_or_none()
     
     if not todo:
         raise HTTPException(
@@ -154,11 +211,26 @@ def update_todo(
         HTTPException 404: If todo not found or doesn't belong to user
     """
     
-    # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.owner_id == current_user.id
-    ).first()
+    # Update fields that were provided
+    update_data = {
+        field: getattr(todo_update, field)
+        for field in todo_update.model_fields_set
+    }
+    
+    if update_data:
+        # Update and read back the row in one statement
+        stmt = (
+            update(Todo)
+            .where(Todo.id == todo_id, Todo.owner_id == current_user.id)
+            .values(**update_data)
+            .returning(Todo)
+        )
+        todo = db.execute(stmt).scalar_one_or_none()
+    else:
+        # Nothing to change, just find todo
+        todo = db.execute(
+            _select_owned_todo(todo_id, current_user.id)
+        ).scalar_one_or_none()
     
     if not todo:
         raise HTTPException(
@@ -166,16 +238,13 @@ def update_todo(
             detail="Todo not found"
         )
     
-    # Update fields that were provided
-    update_data = todo_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(todo, field, value)
+    # Build the response before commit expires the returned row
+    response = TodoResponse.model_validate(todo)
     
     # Save changes
     db.commit()
-    db.refresh(todo)
     
-    return todo
+    return response
 
 @router.delete("/{todo_id}", response_model=Message)
 def delete_todo(
@@ -198,20 +267,15 @@ def delete_todo(
         HTTPException 404: If todo not found or doesn't belong to user
     """
     
-    # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.owner_id == current_user.id
-    ).first()
+    # Delete todo in one statement; no matching row means not found
+    result = db.execute(_delete_owned_todo(todo_id, current_user.id))
     
-    if not todo:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found"
         )
     
-    # Delete todo
-    db.delete(todo)
     db.commit()
     
     return Message(message="Todo deleted successfully")
@@ -237,11 +301,15 @@ def toggle_todo_completion(
         HTTPException 404: If todo not found or doesn't belong to user
     """
     
-    # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.owner_id == current_user.id
-    ).first()
+    # Toggle completion in the database (SET completed = NOT completed), so
+    # concurrent toggles can't overwrite each other
+    stmt = (
+        update(Todo)
+        .where(Todo.id == todo_id, Todo.owner_id == current_user.id)
+        .values(completed=~Todo.completed)
+        .returning(Todo)
+    )
+    todo = db.execute(stmt).scalar_one_or_none()
     
     if not todo:
         raise HTTPException(
@@ -249,11 +317,10 @@ def toggle_todo_completion(
             detail="Todo not found"
         )
     
-    # Toggle completion
-    todo.completed = not todo.completed
+    # Build the response before commit expires the returned row
+    response = TodoResponse.model_validate(todo)
     
     # Save changes
     db.commit()
-    db.refresh(todo)
     
-    return todo
\ No newline at end of file
+    return response
\ No newline at end of file
@@ -1,7 +1,21 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
 
+# ============ MODEL CONFIGS ============
+
+# Response schemas are built from trusted ORM objects/rows, so optional
+# validation passes are switched off explicitly
+RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,  # Allow Pydantic to work with SQLAlchemy models
+    str_strip_whitespace=False,
+    validate_assignment=False,
+    revalidate_instances="never",
+)
+
+# Request schemas reject unknown fields and cap every string in pydantic-core
+REQUEST_CONFIG = ConfigDict(extra="forbid", str_max_length=1000)
+
 # ============ USER SCHEMAS ============
 
 class UserBase(BaseModel):
@@ -11,7 +25,17 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     """Schema for user registration"""
-    password: str = Field(..., min_length=6, description="Password (min 6 characters)")
+    model_config = REQUEST_CONFIG
+    
+    password: str = Field(
+        ...,
+        min_length=6,
+        max_length=72,
+        description=(
+            "Password (6-72 characters). Only the first 72 bytes are used, as "
+            "with bcrypt; pre-hash longer passphrases (e.g. SHA-256) client-side"
+        )
+    )
 
 class UserResponse(UserBase):
     """Schema for user data in API responses"""
@@ -19,9 +43,7 @@ class UserResponse(UserBase):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        # Allow Pydantic to work with SQLAlchemy models
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 # ============ TODO SCHEMAS ============
 
@@ -32,10 +54,13 @@ class TodoBase(BaseModel):
 
 class TodoCreate(TodoBase):
     """Schema for creating new todos"""
-    pass  # Inherits all fields from TodoBase
+    # Inherits all fields from TodoBase
+    model_config = REQUEST_CONFIG
 
 class TodoUpdate(BaseModel):
     """Schema for updating existing todos"""
+    model_config = REQUEST_CONFIG
+    
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
     completed: Optional[bool] = None
@@ -48,8 +73,7 @@ class TodoResponse(TodoBase):
     created_at: datetime
     updated_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 class TodoWithOwner(TodoResponse):
     """Todo response with owner information"""
@@ -5,7 +5,8 @@ from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.database import get_db, Base
 from app.models import User
-from app.auth import get_password_hash
+from app.auth import clear_token_caches, get_password_hash
+from app.dependencies import clear_user_cache
 
 # Test database (in-memory SQLite)
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -23,6 +24,13 @@ def override_get_db():
 # Override dependency
 app.dependency_overrides[get_db] = override_get_db
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Start every test with empty token and user caches"""
+    clear_token_caches()
+    clear_user_cache()
+    yield
+
 @pytest.fixture(scope="function")
 def db():
     """Create test database"""
@@ -1,3 +1,19 @@
+import asyncio
+from datetime import timedelta
+import bcrypt
+import jwt
+import pytest
+from fastapi import HTTPException
+from app.auth import (
+    create_access_token,
+    get_password_hash,
+    verify_password,
+    verify_token,
+)
+from app.config import settings
+from app.dependencies import get_current_user
+from app.models import User
+
 def test_register_user(client, db):
     """Test user registration"""
     response = client.post("/auth/register", json={
@@ -37,4 +53,134 @@ def test_get_current_user(client, test_user):
     })
     assert response.status_code == 200
     data = response.json()
-    assert data["username"] == "testuser"
\ No newline at end of file
+    assert data["username"] == "testuser"
+
+def test_password_hash_uses_configured_rounds():
+    """Test password hashes use the configured bcrypt work factor"""
+    hashed = get_password_hash("password123")
+    assert hashed.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+    assert verify_password("password123", hashed)
+    assert not verify_password("wrongpass", hashed)
+
+def test_login_rejects_unknown_user_and_wrong_password(client, test_user):
+    """Test unknown users and wrong passwords get the same error"""
+    unknown = client.post("/auth/login", data={
+        "username": "nosuchuser",
+        "password": "testpass123"
+    })
+    wrong = client.post("/auth/login", data={
+        "username": "testuser",
+        "password": "wrongpass"
+    })
+    assert unknown.status_code == wrong.status_code == 401
+    assert unknown.json() == wrong.json()
+
+def test_login_rehashes_other_work_factor(client, db):
+    """Test login moves hashes made with another work factor to the configured one"""
+    user = User(
+        email="legacy@example.com",
+        username="legacyuser",
+        hashed_password=bcrypt.hashpw(b"testpass123", bcrypt.gensalt(rounds=4)).decode()
+    )
+    db.add(user)
+    db.commit()
+    
+    response = client.post("/auth/login", data={
+        "username": "legacyuser",
+        "password": "testpass123"
+    })
+    assert response.status_code == 200
+    
+    db.refresh(user)
+    assert user.hashed_password.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+    assert verify_password("testpass123", user.hashed_password)
+
+def test_register_duplicate_email_and_username(client, test_user):
+    """Test registration rejects an existing email or username"""
+    response = client.post("/auth/register", json={
+        "email": "test@example.com",
+        "username": "otheruser",
+        "password": "password123"
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+    
+    response = client.post("/auth/register", json={
+        "email": "other@example.com",
+        "username": "testuser",
+        "password": "password123"
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Username already taken"
+
+def test_expired_token_rejected(client, test_user):
+    """Test an expired token is rejected"""
+    token = create_access_token(
+        data={"sub": "testuser"},
+        expires_delta=timedelta(minutes=-1)
+    )
+    response = client.get("/auth/me", headers={
+        "Authorization": f"Bearer {token}"
+    })
+    assert response.status_code == 401
+
+def test_access_token_is_standard_jwt():
+    """Test tokens from the fast signer verify with a standard JWT library"""
+    token = create_access_token(data={"sub": "testuser"})
+    payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+    assert payload["sub"] == "testuser"
+    assert verify_token(token) == "testuser"
+    
+    # A tampered signature is rejected
+    header, payload, signature = token.split(".")
+    middle = len(signature) // 2
+    flipped = "B" if signature[middle] == "A" else "A"
+    tampered = signature[:middle] + flipped + signature[middle + 1:]
+    assert verify_token(f"{header}.{payload}.{tampered}") is None
+    
+    # So is a re-encoding of the same signature using the spare low bits of
+    # the last base64url character
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    reencoded = signature[:-1] + alphabet[alphabet.index(signature[-1]) ^ 1]
+    assert verify_token(f"{header}.{payload}.{reencoded}") is None
+
+def test_password_length_capped_at_bcrypt_limit(client, test_user):
+    """Test passwords are limited to the 72 bytes bcrypt uses"""
+    response = client.post("/auth/register", json={
+        "email": "newuser@example.com",
+        "username": "newuser",
+        "password": "x" * 73
+    })
+    assert response.status_code == 422
+    
+    # Only the first 72 bytes take part in hashing and verification
+    hashed = get_password_hash("x" * 72)
+    assert verify_password("x" * 72 + "ignored", hashed)
+    
+    # Oversized login passwords are rejected without error
+    response = client.post("/auth/login", data={
+        "username": "testuser",
+        "password": "x" * 1_000_000
+    })
+    assert response.status_code == 401
+
+
+def test_rejected_token_errors_do_not_accumulate(db):
+    """Test repeated 401s don't grow one shared exception's traceback"""
+    def raise_for_bad_token():
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_current_user(token="bad", db=db))
+        return exc_info.value
+    
+    def traceback_depth(exc):
+        depth, tb = 0, exc.__traceback__
+        while tb is not None:
+            depth, tb = depth + 1, tb.tb_next
+        return depth
+    
+    first = raise_for_bad_token()
+    errors = [raise_for_bad_token() for _ in range(20)]
+    
+    assert all(exc is not first for exc in errors)
+    assert all(traceback_depth(exc) == traceback_depth(first) for exc in errors)
+    assert first.status_code == 401
@@ -0,0 +1,57 @@
+import pytest
+from starlette.middleware.cors import CORSMiddleware
+from starlette.testclient import TestClient
+from app.main import CORS_OPTIONS
+from app.middleware import PreflightCacheMiddleware
+
+async def empty_app(scope, receive, send):
+    """ASGI app that should never be reached by a preflight"""
+    raise AssertionError("preflight reached the app")
+
+def preflight(client, origin, method="POST", request_headers="authorization"):
+    """Send a CORS preflight request"""
+    return client.options("/todos", headers={
+        "Origin": origin,
+        "Access-Control-Request-Method": method,
+        "Access-Control-Request-Headers": request_headers
+    })
+
+def assert_same_response(response, expected):
+    """Assert two responses are identical"""
+    assert response.status_code == expected.status_code
+    assert response.text == expected.text
+    assert dict(response.headers) == dict(expected.headers)
+
+def test_preflight_matches_cors_middleware(client):
+    """Test the app's cached preflight responses match CORSMiddleware's"""
+    reference = TestClient(CORSMiddleware(empty_app, **CORS_OPTIONS))
+    origin = CORS_OPTIONS["allow_origins"][0]
+    
+    response = preflight(client, origin)
+    assert response.status_code == 200
+    assert_same_response(response, preflight(reference, origin))
+
+@pytest.mark.parametrize("options", [
+    {"allow_methods": ["*"], "allow_headers": ["*"], "allow_credentials": True},
+    {"allow_methods": ["*"], "allow_headers": ["*"], "allow_credentials": False},
+    {"allow_methods": ["GET"], "allow_headers": ["*"], "allow_credentials": True},
+    {"allow_methods": ["*"], "allow_headers": ["X-Other"]},
+    {"allow_methods": ["*"], "allow_headers": ["*"], "max_age": 60},
+])
+def test_preflight_follows_cors_policy(options):
+    """Test the preflight cache never answers differently from CORSMiddleware"""
+    options = {"allow_origins": ["http://localhost:3000"], **options}
+    reference = TestClient(CORSMiddleware(empty_app, **options))
+    cached = TestClient(PreflightCacheMiddleware(
+        CORSMiddleware(empty_app, **options), **options
+    ))
+    
+    assert_same_response(
+        preflight(cached, "http://localhost:3000"),
+        preflight(reference, "http://localhost:3000")
+    )
+
+def test_preflight_unknown_origin_rejected(client):
+    """Test preflights from unknown origins fall through to CORSMiddleware"""
+    response = preflight(client, "http://evil.example.com")
+    assert response.status_code == 400
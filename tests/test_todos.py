@@ -55,7 +55,14 @@ def test_update_todo(client, auth_headers):
     assert response.status_code == 200
     data = response.json()
     assert data["title"] == "Updated Title"
+    assert data["description"] == "Original description"
     assert data["completed"] == True
+    assert data["updated_at"] is not None
+
+def test_update_todo_not_found(client, auth_headers):
+    """Test updating a missing todo"""
+    response = client.put("/todos/999", json={"title": "Nope"}, headers=auth_headers)
+    assert response.status_code == 404
 
 def test_delete_todo(client, auth_headers):
     """Test deleting a todo"""
@@ -72,4 +79,88 @@ def test_delete_todo(client, auth_headers):
     
     # Verify deletion
     get_response = client.get(f"/todos/{todo_id}", headers=auth_headers)
-    assert get_response.status_code == 404
\ No newline at end of file
+    assert get_response.status_code == 404
+
+def test_get_todos_pagination(client, auth_headers):
+    """Test paginated todos report the total across all pages"""
+    for i in range(3):
+        client.post("/todos", json={"title": f"Todo {i}"}, headers=auth_headers)
+    
+    response = client.get("/todos?page=2&per_page=2", headers=auth_headers)
+    data = response.json()
+    assert [todo["title"] for todo in data["todos"]] == ["Todo 2"]
+    assert data["total"] == 3
+    
+    # Past the last page there are no todos but the total is still known
+    response = client.get("/todos?page=3&per_page=2", headers=auth_headers)
+    data = response.json()
+    assert data["todos"] == []
+    assert data["total"] == 3
+
+def test_toggle_todo(client, auth_headers):
+    """Test toggling a todo's completion status"""
+    create_response = client.post("/todos", json={
+        "title": "Toggle me"
+    }, headers=auth_headers)
+    todo_id = create_response.json()["id"]
+    
+    response = client.post(f"/todos/{todo_id}/toggle", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["completed"] == True
+    
+    response = client.post(f"/todos/{todo_id}/toggle", headers=auth_headers)
+    assert response.json()["completed"] == False
+    
+    response = client.post("/todos/999/toggle", headers=auth_headers)
+    assert response.status_code == 404
+
+def test_create_todo_rejects_unknown_fields(client, auth_headers):
+    """Test request bodies with unknown fields are rejected"""
+    response = client.post("/todos", json={
+        "title": "Test Todo",
+        "owner_id": 42
+    }, headers=auth_headers)
+    assert response.status_code == 422
+
+def test_get_todos_matches_todo_response(client, auth_headers):
+    """Test list items are serialized exactly like single todos"""
+    create_response = client.post("/todos", json={
+        "title": "Test Todo",
+        "description": "Test description"
+    }, headers=auth_headers)
+    todo_id = create_response.json()["id"]
+    
+    list_response = client.get("/todos", headers=auth_headers)
+    assert list_response.headers["content-type"] == "application/json"
+    data = list_response.json()
+    assert data["page"] == 1
+    assert data["per_page"] == 10
+    
+    todo_response = client.get(f"/todos/{todo_id}", headers=auth_headers)
+    assert data["todos"] == [todo_response.json()]
+
+def test_get_todos_search(client, auth_headers):
+    """Test searching todos is case-insensitive across title and description"""
+    client.post("/todos", json={"title": "Buy Milk"}, headers=auth_headers)
+    client.post("/todos", json={
+        "title": "Chores",
+        "description": "Walk the DOG"
+    }, headers=auth_headers)
+    
+    response = client.get("/todos?search=milk", headers=auth_headers)
+    assert [todo["title"] for todo in response.json()["todos"]] == ["Buy Milk"]
+    
+    response = client.get("/todos?search=dog", headers=auth_headers)
+    assert [todo["title"] for todo in response.json()["todos"]] == ["Chores"]
+
+def test_get_and_delete_todo_by_id(client, auth_headers):
+    """Test single-todo lookups bind the requested id on every call"""
+    first_id = client.post("/todos", json={"title": "First"}, headers=auth_headers).json()["id"]
+    second_id = client.post("/todos", json={"title": "Second"}, headers=auth_headers).json()["id"]
+    
+    assert client.get(f"/todos/{first_id}", headers=auth_headers).json()["title"] == "First"
+    assert client.get(f"/todos/{second_id}", headers=auth_headers).json()["title"] == "Second"
+    
+    assert client.delete(f"/todos/{first_id}", headers=auth_headers).status_code == 200
+    assert client.delete(f"/todos/{first_id}", headers=auth_headers).status_code == 404
+    assert client.get(f"/todos/{second_id}", headers=auth_headers).status_code == 200